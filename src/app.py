@@ -7,7 +7,8 @@ for extracurricular activities at Mergington High School.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response
+import json
 import os
 from pathlib import Path
 
@@ -25,58 +26,68 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Basketball Team": {
         "description": "Competitive basketball training and matches",
         "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
+        "participants": dict.fromkeys(["alex@mergington.edu"])
     },
     "Tennis Club": {
         "description": "Tennis training and friendly tournaments",
         "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
         "max_participants": 10,
-        "participants": ["james@mergington.edu", "nina@mergington.edu"]
+        "participants": dict.fromkeys(["james@mergington.edu", "nina@mergington.edu"])
     },
     "Art Studio": {
         "description": "Painting, drawing, and visual arts techniques",
         "schedule": "Tuesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["sarah@mergington.edu"]
+        "participants": dict.fromkeys(["sarah@mergington.edu"])
     },
     "Music Ensemble": {
         "description": "Orchestra and band performance group",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["lucas@mergington.edu", "maya@mergington.edu"]
+        "participants": dict.fromkeys(["lucas@mergington.edu", "maya@mergington.edu"])
     },
     "Debate Club": {
         "description": "Develop public speaking and argumentation skills",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["rachel@mergington.edu"]
+        "participants": dict.fromkeys(["rachel@mergington.edu"])
     },
     "Science Club": {
         "description": "Explore physics, chemistry, and biology through experiments",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["tom@mergington.edu", "jessica@mergington.edu"]
+        "participants": dict.fromkeys(["tom@mergington.edu", "jessica@mergington.edu"])
     }
 }
 
+# Serialized GET /activities body, reused until the activities change
+_activities_version = 0
+_cached_payload = (-1, b"")
+
+
+def invalidate_activities_cache():
+    """Mark the activities as changed so the next GET re-serializes them"""
+    global _activities_version
+    _activities_version += 1
+
 
 @app.get("/")
 def root():
@@ -85,7 +96,19 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    global _cached_payload
+    # Read the version before serializing so a concurrent change is never
+    # cached under its newer version
+    version = _activities_version
+    if _cached_payload[0] != version:
+        # Participants are stored as insertion-ordered dicts; serialize them as lists
+        data = {
+            name: {**details, "participants": list(details["participants"])}
+            for name, details in activities.items()
+        }
+        content = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        _cached_payload = (version, content)
+    return Response(content=_cached_payload[1], media_type="application/json")
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +126,8 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
+    invalidate_activities_cache()
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -122,5 +146,6 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student not registered for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    activity["participants"].pop(email)
+    invalidate_activities_cache()
     return {"message": f"Unregistered {email} from {activity_name}"}
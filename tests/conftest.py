@@ -0,0 +1,28 @@
+"""
+Shared pytest configuration for the Mergington High School Activities API tests
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src directory to path to import app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app import app, activities  # noqa: E402,F401
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given"""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -2,162 +2,184 @@
 Tests for the Mergington High School Activities API
 """
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from pathlib import Path
-import sys
+import pytest_asyncio
+from types import MappingProxyType
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# conftest.py puts src/ on sys.path before this module is imported
+from app import app, activities, invalidate_activities_cache
 
-from app import app, activities
+# Run every test on the session event loop shared with the client fixture
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the app"""
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create an async test client shared by all tests in the session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before and after each test"""
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and matches",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Tennis training and friendly tournaments",
-            "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
-            "max_participants": 10,
-            "participants": ["james@mergington.edu", "nina@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and visual arts techniques",
-            "schedule": "Tuesdays and Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["sarah@mergington.edu"]
-        },
-        "Music Ensemble": {
-            "description": "Orchestra and band performance group",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu", "maya@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop public speaking and argumentation skills",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["rachel@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Explore physics, chemistry, and biology through experiments",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["tom@mergington.edu", "jessica@mergington.edu"]
-        }
+async def _signup(client, activity, email):
+    """Sign up a student, letting httpx encode the path and query"""
+    return await client.post(f"/activities/{activity}/signup", params={"email": email})
+
+
+async def _unregister(client, activity, email):
+    """Unregister a student, letting httpx encode the path and query"""
+    return await client.delete(f"/activities/{activity}/unregister", params={"email": email})
+
+
+# Initial activities data, frozen so tests cannot mutate it
+_TEMPLATE = MappingProxyType({
+    "Chess Club": MappingProxyType({
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ("michael@mergington.edu", "daniel@mergington.edu")
+    }),
+    "Programming Class": MappingProxyType({
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ("emma@mergington.edu", "sophia@mergington.edu")
+    }),
+    "Gym Class": MappingProxyType({
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ("john@mergington.edu", "olivia@mergington.edu")
+    }),
+    "Basketball Team": MappingProxyType({
+        "description": "Competitive basketball training and matches",
+        "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ("alex@mergington.edu",)
+    }),
+    "Tennis Club": MappingProxyType({
+        "description": "Tennis training and friendly tournaments",
+        "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
+        "max_participants": 10,
+        "participants": ("james@mergington.edu", "nina@mergington.edu")
+    }),
+    "Art Studio": MappingProxyType({
+        "description": "Painting, drawing, and visual arts techniques",
+        "schedule": "Tuesdays and Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ("sarah@mergington.edu",)
+    }),
+    "Music Ensemble": MappingProxyType({
+        "description": "Orchestra and band performance group",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": ("lucas@mergington.edu", "maya@mergington.edu")
+    }),
+    "Debate Club": MappingProxyType({
+        "description": "Develop public speaking and argumentation skills",
+        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ("rachel@mergington.edu",)
+    }),
+    "Science Club": MappingProxyType({
+        "description": "Explore physics, chemistry, and biology through experiments",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ("tom@mergington.edu", "jessica@mergington.edu")
+    })
+})
+
+
+def _fresh_activities():
+    """Build a mutable copy of the activities template"""
+    return {
+        name: {**details, "participants": dict.fromkeys(details["participants"])}
+        for name, details in _TEMPLATE.items()
     }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Reset after test
+
+
+def _restore_activities():
+    """Restore activities to the initial template state"""
     activities.clear()
-    activities.update(original_activities)
+    activities.update(_fresh_activities())
+    invalidate_activities_cache()
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state before each test"""
+    _restore_activities()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def activities_snapshot(client):
+    """Fetch the initial activities once for read-only tests"""
+    _restore_activities()
+    response = await client.get("/activities")
+    response.raise_for_status()
+    return response.json()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities(self, client, reset_activities):
+    async def test_get_activities(self, activities_snapshot):
         """Test fetching all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        data = activities_snapshot
         assert len(data) == 9
         assert "Chess Club" in data
         assert data["Chess Club"]["max_participants"] == 12
-        assert len(data["Chess Club"]["participants"]) == 2
+        assert data["Chess Club"]["participants"] == ["michael@mergington.edu", "daniel@mergington.edu"]
+    
+    @pytest.mark.parametrize("name", list(_TEMPLATE))
+    async def test_get_activities_structure(self, activities_snapshot, name):
+        """Test that each activity has the correct structure"""
+        data = activities_snapshot[name]
+        
+        assert {"description", "schedule", "max_participants", "participants"} <= data.keys()
+        assert isinstance(data["participants"], list)
+    
+    async def test_get_activities_reflects_signup(self, client, reset_activities):
+        """Test that a cached response is refreshed after a signup"""
+        await client.get("/activities")
+        await _signup(client, "Chess Club", "newstudent@mergington.edu")
+        
+        response = await client.get("/activities")
+        assert "newstudent@mergington.edu" in response.json()["Chess Club"]["participants"]
     
-    def test_get_activities_structure(self, client, reset_activities):
-        """Test that activities have correct structure"""
-        response = client.get("/activities")
-        data = response.json()
+    async def test_get_activities_reflects_unregister(self, client, reset_activities):
+        """Test that a cached response is refreshed after an unregister"""
+        await client.get("/activities")
+        await _unregister(client, "Chess Club", "michael@mergington.edu")
         
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-            assert isinstance(activity_data["participants"], list)
+        response = await client.get("/activities")
+        assert "michael@mergington.edu" not in response.json()["Chess Club"]["participants"]
 
 
 class TestSignUp:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_participant(self, client, reset_activities):
+    async def test_signup_new_participant(self, client, reset_activities):
         """Test signing up a new participant"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
-        )
+        response = await _signup(client, "Chess Club", "newstudent@mergington.edu")
         assert response.status_code == 200
-        data = response.json()
-        assert "Signed up" in data["message"]
-        assert "newstudent@mergington.edu" in data["message"]
+        assert b"Signed up" in response.content
+        assert b"newstudent@mergington.edu" in response.content
         
         # Verify participant was added
         assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_duplicate_participant(self, client, reset_activities):
+    async def test_signup_duplicate_participant(self, client, reset_activities):
         """Test that duplicate signup fails"""
-        response = client.post(
-            "/activities/Chess%20Club/signup?email=michael@mergington.edu"
-        )
+        response = await _signup(client, "Chess Club", "michael@mergington.edu")
         assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"]
+        assert b"already signed up" in response.content
     
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signing up for non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent%20Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_signup_multiple_participants(self, client, reset_activities):
+    async def test_signup_multiple_participants(self, client, reset_activities):
         """Test signing up multiple different participants"""
-        response1 = client.post(
-            "/activities/Basketball%20Team/signup?email=student1@mergington.edu"
-        )
-        response2 = client.post(
-            "/activities/Basketball%20Team/signup?email=student2@mergington.edu"
-        )
+        response1 = await _signup(client, "Basketball Team", "student1@mergington.edu")
+        response2 = await _signup(client, "Basketball Team", "student2@mergington.edu")
         
         assert response1.status_code == 200
         assert response2.status_code == 200
@@ -168,85 +190,78 @@ class TestSignUp:
 class TestUnregister:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_participant(self, client, reset_activities):
+    async def test_unregister_participant(self, client, reset_activities):
         """Test unregistering a participant"""
         # First verify participant exists
         assert "michael@mergington.edu" in activities["Chess Club"]["participants"]
         
         # Unregister
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
-        )
+        response = await _unregister(client, "Chess Club", "michael@mergington.edu")
         assert response.status_code == 200
-        data = response.json()
-        assert "Unregistered" in data["message"]
+        assert b"Unregistered" in response.content
         
         # Verify participant was removed
         assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_unregister_nonexistent_participant(self, client, reset_activities):
+    async def test_unregister_nonexistent_participant(self, client, reset_activities):
         """Test unregistering a participant not in activity"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=nonexistent@mergington.edu"
-        )
+        response = await _unregister(client, "Chess Club", "nonexistent@mergington.edu")
         assert response.status_code == 400
-        data = response.json()
-        assert "not registered" in data["detail"]
-    
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
-        """Test unregistering from non-existent activity"""
-        response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "Activity not found" in data["detail"]
+        assert b"not registered" in response.content
     
-    def test_unregister_then_signup_again(self, client, reset_activities):
+    async def test_unregister_then_signup_again(self, client, reset_activities):
         """Test that participant can re-signup after unregistering"""
         email = "michael@mergington.edu"
         
         # Unregister
-        response1 = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response1 = await _unregister(client, "Chess Club", email)
         assert response1.status_code == 200
         assert email not in activities["Chess Club"]["participants"]
         
         # Sign up again
-        response2 = client.post(
-            f"/activities/Chess%20Club/signup?email={email}"
-        )
+        response2 = await _signup(client, "Chess Club", email)
         assert response2.status_code == 200
         assert email in activities["Chess Club"]["participants"]
 
 
+class TestNonexistentActivity:
+    """Tests for endpoints called with an unknown activity"""
+    
+    @pytest.mark.parametrize("request_fn", [_signup, _unregister], ids=["signup", "unregister"])
+    async def test_nonexistent_activity(self, client, request_fn):
+        """Test signing up for or unregistering from a non-existent activity"""
+        response = await request_fn(client, "Nonexistent Activity", "test@mergington.edu")
+        assert response.status_code == 404
+        assert b"Activity not found" in response.content
+
+
 class TestIntegration:
     """Integration tests for multiple operations"""
     
-    def test_full_workflow(self, client, reset_activities):
+    @pytest.mark.slow
+    async def test_full_workflow(self, client, reset_activities):
         """Test complete workflow: signup, verify, unregister, verify"""
         email = "integration@mergington.edu"
-        activity = "Tennis%20Club"
+        activity = "Tennis Club"
         
         # Check initial state
-        response = client.get("/activities")
-        initial_count = len(response.json()["Tennis Club"]["participants"])
+        response = await client.get("/activities")
+        participants = response.json()["Tennis Club"]["participants"]
+        initial_count = len(participants)
+        assert email not in participants
         
         # Sign up
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = await _signup(client, activity, email)
         assert response.status_code == 200
         
         # Verify signup
-        response = client.get("/activities")
-        assert len(response.json()["Tennis Club"]["participants"]) == initial_count + 1
-        assert email in response.json()["Tennis Club"]["participants"]
+        assert len(activities["Tennis Club"]["participants"]) == initial_count + 1
+        assert email in activities["Tennis Club"]["participants"]
         
         # Unregister
-        response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        response = await _unregister(client, activity, email)
         assert response.status_code == 200
         
         # Verify unregister
-        response = client.get("/activities")
-        assert len(response.json()["Tennis Club"]["participants"]) == initial_count
-        assert email not in response.json()["Tennis Club"]["participants"]
+        assert len(activities["Tennis Club"]["participants"]) == initial_count
+        assert email not in activities["Tennis Club"]["participants"]